@@ -51,6 +51,9 @@ class CSVDataFeedProvider(DataFeedProvider):
             logger.info(f"Found {len(files)} CSV files in data folder: {files}")
         else:
             logger.warning(f"Data folder does not exist: {self.data_folder}")
+        
+        # Parsed CSV files keyed by base ticker, with the file stamp they were read at
+        self._csv_cache = {}
     
     def _get_base_ticker(self, ticker):
         """
@@ -155,6 +158,14 @@ class CSVDataFeedProvider(DataFeedProvider):
             return None
         
         try:
+            # Reuse the parsed file until it is modified on disk; callers get a
+            # copy since they reassign columns on the returned frame
+            stat = os.stat(csv_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = self._csv_cache.get(base_ticker)
+            if cached is not None and cached[0] == stamp:
+                return cached[1].copy()
+            
             # Try to load the CSV file
             df = pd.read_csv(csv_path)
             
@@ -168,7 +179,8 @@ class CSVDataFeedProvider(DataFeedProvider):
             if 'DATE' in df.columns:
                 df['DATE'] = pd.to_datetime(df['DATE'], errors='coerce')
             
-            return df
+            self._csv_cache[base_ticker] = (stamp, df)
+            return df.copy()
         except Exception as e:
             logger.error(f"Error loading CSV file {csv_path}: {e}")
             return None
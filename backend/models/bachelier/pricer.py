@@ -3,13 +3,25 @@ Bachelier option pricing model implementation.
 """
 
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Normalizing constant of the standard normal density
+_NORM_PDF_C = np.sqrt(2 * np.pi)
+
+
+def _norm_pdf(d):
+    """
+    Standard normal density, the formula scipy.stats.norm.pdf evaluates
+    without the distribution object's argument handling.
+    """
+    return np.exp(-d**2 / 2.0) / _NORM_PDF_C
+
+
 class BachelierOptionPricer:
     """
     Class for pricing options using the Bachelier (normal) model, particularly
@@ -60,8 +72,8 @@ class BachelierOptionPricer:
             intrinsic = max(0, K - S0)
         
         # Standard normal CDF and PDF
-        Nd = norm.cdf(d)
-        nd = norm.pdf(d)
+        Nd = ndtr(d)
+        nd = _norm_pdf(d)
         
         # Option price calculation
         if option_type.lower() == 'call':
@@ -103,11 +115,11 @@ class BachelierOptionPricer:
         
         # Delta calculation with sign correction
         if option_type.lower() == 'call':
-            delta_value = df * norm.cdf(d)
+            delta_value = df * ndtr(d)
             # Ensure call delta is positive
             delta_value = max(0, delta_value)
         else:  # put option
-            delta_value = df * (norm.cdf(d) - 1)
+            delta_value = df * (ndtr(d) - 1)
             # Ensure put delta is negative
             delta_value = min(0, delta_value)
         
@@ -143,9 +155,9 @@ class BachelierOptionPricer:
         # For a call option, when secondary differential increases, strike increases, reducing value
         # For a put option, when secondary differential increases, strike increases, increasing value
         if option_type.lower() == 'call':
-            return -df * norm.cdf(d)  # Negative of regular delta
+            return -df * ndtr(d)  # Negative of regular delta
         else:  # put option
-            return -df * (norm.cdf(d) - 1)  # Negative of regular delta
+            return -df * (ndtr(d) - 1)  # Negative of regular delta
             
     def gamma(self, S0, K, T, sigma, option_type='call', r=0):
         """
@@ -157,7 +169,7 @@ class BachelierOptionPricer:
             return 0.0
         
         d = (S0 - K) / (sigma * np.sqrt(T))
-        pdf_d = norm.pdf(d)
+        pdf_d = _norm_pdf(d)
         denom = sigma * np.sqrt(T)
         
         gamma = df * pdf_d / denom
@@ -187,7 +199,7 @@ class BachelierOptionPricer:
         d = (S0 - K) / (sigma * np.sqrt(T))
         
         # Vega is the same for call and put
-        return df * norm.pdf(d) * np.sqrt(T)
+        return df * _norm_pdf(d) * np.sqrt(T)
     
     def theta(self, S0, K, T, sigma, option_type='call', r=0):
         """
@@ -212,9 +224,9 @@ class BachelierOptionPricer:
         d = (S0 - K) / (sigma * np.sqrt(T))
         
         # Common term
-        common_term = -sigma * norm.pdf(d) / (2 * np.sqrt(T))
+        common_term = -sigma * _norm_pdf(d) / (2 * np.sqrt(T))
         
         if option_type.lower() == 'call':
-            return df * (common_term + r * (S0 - K) * norm.cdf(d))
+            return df * (common_term + r * (S0 - K) * ndtr(d))
         else:  # put option
-            return df * (common_term + r * (K - S0) * norm.cdf(-d))
\ No newline at end of file
+            return df * (common_term + r * (K - S0) * ndtr(-d))
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""
+Numerical kernels for the volatility model.
+
+Kernels are compiled with Numba when it is installed and run as plain
+Python functions otherwise.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit that returns the function unchanged.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def ann_vol_from_prices(prices):
+    """
+    Annualized volatility of absolute price changes in a single pass.
+    
+    Uses Welford's online variance over consecutive price differences,
+    skipping differences that involve a missing price, so no temporary
+    arrays are allocated.
+    
+    Args:
+        prices: 1-D float64 array of prices in chronological order
+    
+    Returns:
+        float: Annualized volatility (252 trading days), NaN if fewer than
+            two price changes are available
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, prices.shape[0]):
+        change = prices[i] - prices[i - 1]
+        if math.isnan(change):
+            continue
+        count += 1
+        delta = change - mean
+        mean += delta / count
+        m2 += delta * (change - mean)
+    
+    if count < 2:
+        return math.nan
+    
+    return math.sqrt(m2 / (count - 1)) * math.sqrt(252.0)
+
+
+@njit(cache=True)
+def heston_iv(moneyness, v0, kappa, sigma, rho):
+    """
+    Heston smile approximation of the implied volatility at one moneyness.
+    
+    Args:
+        moneyness: Moneyness (K/F)
+        v0, kappa, sigma, rho: Heston parameters
+    
+    Returns:
+        float: Implied volatility as a decimal, 0.25 for invalid moneyness
+    """
+    if not (moneyness > 0 and math.isfinite(moneyness)):
+        return 0.25
+    
+    log_moneyness = math.log(moneyness)
+    skew_term = rho * sigma / kappa
+    curvature_term = (1 - rho**2) * sigma**2 / (2 * kappa**2)
+    implied_vol = math.sqrt(v0) * (1 + skew_term * log_moneyness + curvature_term * log_moneyness**2)
+    return max(0.01, min(implied_vol, 2.0))
+
+
+@njit(cache=True)
+def heston_ivs(moneyness, v0, kappa, sigma, rho):
+    """
+    Heston smile approximation over an array of moneyness values.
+    
+    Args:
+        moneyness: 1-D float64 array of moneyness values (K/F)
+        v0, kappa, sigma, rho: Heston parameters
+    
+    Returns:
+        np.ndarray: Implied volatilities as decimals, 0.25 for invalid moneyness
+    """
+    implied_vols = np.empty(moneyness.shape[0])
+    for i in range(moneyness.shape[0]):
+        implied_vols[i] = heston_iv(moneyness[i], v0, kappa, sigma, rho)
+    return implied_vols
+
+
+@njit(cache=True)
+def bachelier_delta(forward, strike, sqrt_t, volatility, is_call):
+    """
+    Bachelier delta of one option.
+    
+    Args:
+        forward: Forward price
+        strike: Strike price
+        sqrt_t: Square root of the time to maturity in years
+        volatility: Normal volatility
+        is_call: True for calls, False for puts
+    
+    Returns:
+        float: Delta, the intrinsic exercise indicator at zero volatility or maturity
+    """
+    if volatility <= 0 or sqrt_t <= 0:
+        if abs(forward - strike) < 0.0001:
+            return 0.5 if is_call else -0.5
+        elif is_call:
+            return 1.0 if forward > strike else 0.0
+        else:
+            return -1.0 if forward < strike else 0.0
+    
+    d = (forward - strike) / (volatility * sqrt_t)
+    delta = 0.5 * math.erfc(-d / math.sqrt(2.0))
+    return delta if is_call else delta - 1.0
+
+
+@njit(cache=True)
+def bachelier_deltas(forward, strikes, sqrt_t, volatilities, is_call):
+    """
+    Bachelier deltas over arrays of strikes and normal volatilities.
+    
+    Args:
+        forward: Forward price
+        strikes: 1-D float64 array of strikes
+        sqrt_t: Square root of the time to maturity in years
+        volatilities: 1-D float64 array of normal volatilities, one per strike
+        is_call: True for calls, False for puts
+    
+    Returns:
+        np.ndarray: Deltas
+    """
+    deltas = np.empty(strikes.shape[0])
+    for i in range(strikes.shape[0]):
+        deltas[i] = bachelier_delta(forward, strikes[i], sqrt_t, volatilities[i], is_call)
+    return deltas
+
+
+@njit(cache=True, error_model='numpy')
+def heston_smile(forward, strikes, sqrt_t, v0, kappa, sigma, rho, is_call):
+    """
+    Heston implied vols, normal vols and Bachelier deltas for a whole smile.
+    
+    Fuses the Heston smile approximation, the conversion to normal vol and
+    the Bachelier delta into one loop over the strikes.
+    
+    Args:
+        forward: Forward price
+        strikes: 1-D float64 array of strikes
+        sqrt_t: Square root of the time to maturity in years
+        v0, kappa, sigma, rho: Heston parameters
+        is_call: True for calls, False for puts
+    
+    Returns:
+        tuple: (percentage vols as decimals, normal vols, deltas) arrays
+    """
+    n = strikes.shape[0]
+    percentage_vols = np.empty(n)
+    normal_vols = np.empty(n)
+    deltas = np.empty(n)
+    
+    for i in range(n):
+        strike = strikes[i]
+        
+        # Heston implied vol, default volatility for invalid moneyness
+        implied_vol = heston_iv(strike / forward, v0, kappa, sigma, rho)
+        normal_vol = implied_vol * forward
+        
+        percentage_vols[i] = implied_vol
+        normal_vols[i] = normal_vol
+        deltas[i] = bachelier_delta(forward, strike, sqrt_t, normal_vol, is_call)
+    
+    return percentage_vols, normal_vols, deltas
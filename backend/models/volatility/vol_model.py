@@ -1,16 +1,280 @@
 # backend/models/volatility/vol_model.py
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import combinations
 import logging
+import math
 from typing import Dict, List, Optional, Union, Tuple
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
+from scipy.special import ndtr, ndtri
+
+from ._kernels import (NUMBA_AVAILABLE, ann_vol_from_prices, bachelier_deltas, heston_iv, heston_ivs,
+                       heston_smile)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Key moneyness points always included in an index smile
+_KEY_MONEYNESS = np.array([0.7, 0.8, 0.9, 0.95, 0.975, 0.99, 1.0, 1.01, 1.025, 1.05, 1.1, 1.2, 1.3])
+
+# Key offsets relative to the forward always considered for a spread smile
+_KEY_SPREAD_OFFSETS = np.array([-0.5, -0.25, -0.1, -0.05, 0, 0.05, 0.1, 0.25, 0.5])
+
+# Strike multipliers of a fallback index smile (70% to 130% of forward), with
+# the relative strikes and quadratic vol adjustment they imply. Shared by every
+# fallback smile, so read-only.
+_FALLBACK_MULTIPLIERS = 0.7 + np.arange(7) * 0.1
+_FALLBACK_REL_STRIKES = (_FALLBACK_MULTIPLIERS - 1) * 100
+_FALLBACK_SKEW = 1 + 0.1 * (_FALLBACK_REL_STRIKES / 30)**2
+_FALLBACK_MULTIPLIERS.flags.writeable = False
+_FALLBACK_REL_STRIKES.flags.writeable = False
+_FALLBACK_SKEW.flags.writeable = False
+
+# Annualization factor for daily volatilities (252 trading days)
+_SQRT_252 = math.sqrt(252)
+
+# Heston parameter names and the defaults used when a parameter is missing
+_HESTON_KEYS = ('v0', 'kappa', 'theta', 'sigma', 'rho')
+_HESTON_DEFAULTS = (0.04, 1.5, 0.04, 0.3, -0.7)
+
+
+def _unpack_heston_params(params):
+    """
+    Extract Heston parameters as a tuple, filling in defaults.
+    
+    Args:
+        params: Dictionary of Heston parameters, or an already unpacked tuple
+        
+    Returns:
+        tuple: (v0, kappa, theta, sigma, rho)
+    """
+    if isinstance(params, tuple):
+        return params
+    return tuple(params.get(key, default) for key, default in zip(_HESTON_KEYS, _HESTON_DEFAULTS))
+
+
+def _clip(x, lo, hi):
+    """
+    Clamp a scalar to [lo, hi] in one expression, NaN maps to lo.
+    """
+    return hi if x > hi else (x if x >= lo else lo)
+
+
+def _pearson(prices1, prices2):
+    """
+    Pearson correlation of two aligned float64 arrays, NaN if either is constant.
+    
+    Works on the arrays directly, without the stacking and full 2x2 matrix
+    of np.corrcoef.
+    """
+    dev1 = prices1 - prices1.mean()
+    dev2 = prices2 - prices2.mean()
+    denom = math.sqrt(dev1.dot(dev1) * dev2.dot(dev2))
+    if not denom > 0:
+        return math.nan
+    return _clip(float(dev1.dot(dev2)) / denom, -1.0, 1.0)
+
+
+def _is_call(option_type):
+    """
+    Normalize an option type string ('call' or 'put', any case) to a call flag.
+    """
+    return option_type.lower() == 'call'
+
+
+@lru_cache(maxsize=64)
+def _history_window(evaluation_date, days):
+    """
+    Start and end dates (YYYY-MM-DD) of the history ending at evaluation_date.
+    
+    Memoized, since every historical helper asks for the same window
+    throughout a surface build.
+    """
+    start_date = evaluation_date - timedelta(days=days)
+    return start_date.strftime('%Y-%m-%d'), evaluation_date.strftime('%Y-%m-%d')
+
+
+@lru_cache(maxsize=16)
+def _normal_quantiles(count):
+    """
+    Evenly spaced standard normal quantiles, a deterministic stand-in for
+    count normal draws. The returned array is shared and must not be modified.
+    """
+    quantiles = ndtri((np.arange(count) + 0.5) / count)
+    quantiles.flags.writeable = False
+    return quantiles
+
+
+def _sorted_unique(points):
+    """
+    Sort points and drop exact duplicates in one pass.
+    """
+    points = np.sort(points)
+    if points.size < 2:
+        return points
+    keep = np.empty(points.size, dtype=bool)
+    keep[0] = True
+    np.not_equal(points[1:], points[:-1], out=keep[1:])
+    return points[keep]
+
+
+@lru_cache(maxsize=256)
+def _price_grid(forward, min_price, max_price, num_points):
+    """
+    Strike grid of an index smile, memoized on the exact inputs.
+    
+    The returned array is shared and must not be modified.
+    """
+    # Create denser points near ATM
+    # Use a combination of uniform and normal quantile grids
+    
+    # Uniform distribution for coverage across the entire range
+    uniform_points = np.linspace(min_price, max_price, num_points // 2)
+    
+    # Normal quantiles around ATM for higher density, deterministic so
+    # repeated builds return the same surface
+    normal_std = (max_price - min_price) * 0.15  # 15% of range
+    normal_points = forward + normal_std * _normal_quantiles(num_points // 2)
+    np.clip(normal_points, min_price, max_price, out=normal_points)
+    
+    # Combine both distributions with the key moneyness points and the exact forward
+    all_points = np.concatenate([uniform_points, normal_points, forward * _KEY_MONEYNESS, [forward]])
+    
+    # Sort and remove duplicates, read-only since the grid is shared
+    points = _sorted_unique(all_points)
+    points.flags.writeable = False
+    return points
+
+
+@lru_cache(maxsize=256)
+def _spread_grid(forward, min_spread, max_spread, num_points):
+    """
+    Strike grid of a spread smile, memoized on the exact inputs.
+    
+    The returned array is shared and must not be modified.
+    """
+    # Create denser points near ATM and zero
+    # Use a combination of uniform and two normal quantile grids
+    
+    # Uniform distribution for coverage across the entire range
+    uniform_points = np.linspace(min_spread, max_spread, num_points // 3)
+    
+    # Normal quantiles around ATM for higher density
+    normal_std = (max_spread - min_spread) * 0.15  # 15% of range
+    normal_offsets = normal_std * _normal_quantiles(num_points // 3)
+    normal_points_atm = forward + normal_offsets
+    np.clip(normal_points_atm, min_spread, max_spread, out=normal_points_atm)
+    
+    # Normal quantiles around zero for higher density (if zero is in range)
+    if min_spread <= 0 and max_spread >= 0:
+        normal_points_zero = normal_offsets.copy()
+        np.clip(normal_points_zero, min_spread, max_spread, out=normal_points_zero)
+    else:
+        normal_points_zero = np.array([])
+    
+    # Key relative points that fall inside the range
+    key_points = forward * (1 + _KEY_SPREAD_OFFSETS)
+    key_points = key_points[(key_points >= min_spread) & (key_points <= max_spread)]
+    
+    # Combine all distributions with the key points, the exact forward and zero
+    zero_point = [0.0] if min_spread <= 0 <= max_spread else []
+    all_points = np.concatenate([uniform_points, normal_points_atm, normal_points_zero,
+                                 key_points, [forward], zero_point])
+    
+    # Sort and remove duplicates, read-only since the grid is shared
+    points = _sorted_unique(all_points)
+    points.flags.writeable = False
+    return points
+
+
+@lru_cache(maxsize=16)
+def _mock_dates(start_date, end_date):
+    """
+    Daily dates for mock price series, shared by every index over one range.
+    """
+    return pd.date_range(start=start_date, end=end_date)
+
+
+@lru_cache(maxsize=64)
+def _mock_price_series(index, start_date, end_date):
+    """
+    Mock daily prices for an index when no historical data is available.
+    
+    Memoized and seeded from the inputs, so repeated builds reuse one
+    deterministic series per index and date range. All indices share the
+    same date index, so aligning mock series needs no union of dates.
+    Callers must not modify the returned series.
+    
+    Returns:
+        pd.Series: Prices around 10.0 indexed by date
+    """
+    rng = np.random.default_rng([start_date.toordinal(), end_date.toordinal(), *index.encode()])
+    dates = _mock_dates(start_date, end_date)
+    return pd.Series(rng.normal(10, 0.5, len(dates)), index=dates)
+
+
+@lru_cache(maxsize=512)
+def _calibrate_heston_cached(index, base_vol, time_to_maturity):
+    """
+    Calibrate Heston parameters for an index, memoized on the exact inputs.
+    
+    Returns:
+        tuple: (v0, kappa, theta, sigma, rho)
+    """
+    # Convert from percentage (31%) to decimal (0.31) for Heston calculations
+    decimal_vol = base_vol / 100.0
+    
+    # Initial variance (v0) is square of volatility decimal
+    v0 = decimal_vol**2
+    
+    # CRITICAL SMILE ENHANCEMENT
+    
+    # 1. Kappa (mean reversion speed)
+    # - Force kappa to be small enough to create stronger smile
+    # - Recommended range for visible smile: 0.1-0.8
+    # - Ignore time_to_maturity formula that creates too high values
+    kappa = 0.5  # Fixed value that works well for commodity smiles
+    
+    # 2. Theta (long-run variance)
+    # - Keep theta = v0 for short maturities
+    theta = v0
+    
+    # 3. Sigma (volatility of volatility)
+    # - Critical for smile curvature
+    # - Need sigma large enough relative to kappa
+    # - sigma/kappa ratio determines curvature magnitude
+    # - Target ratio of 1.0-2.0 for pronounced smile
+    
+    # Calculate sigma to achieve desired sigma/kappa ratio
+    sigma_kappa_ratio = 1.5  # Target ratio for strong curvature
+    sigma = kappa * sigma_kappa_ratio  # Ensure sigma is proportionally large enough
+    
+    # 4. Rho (correlation)
+    # - Controls smile asymmetry (skew)
+    # - More negative = steeper downward slope on right side
+    # - For commodity markets: usually -0.3 to -0.8
+    
+    # Different rho for different product types
+    if "spread" in index.lower() or "-" in index:
+        # Spread options typically have more pronounced skew
+        rho = -0.7
+    else:
+        # Outright options
+        rho = -0.6
+    
+    # Lazy %-style arguments, nothing is formatted unless debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Calibrated Heston params for %s (base_vol=%s, time=%s): "
+                     "v0=%s, kappa=%s, theta=%s, sigma=%s, rho=%s",
+                     index, base_vol, time_to_maturity, v0, kappa, theta, sigma, rho)
+    
+    return v0, kappa, theta, sigma, rho
+
+
 class VolatilityModel:
     """
     Volatility model using Heston stochastic volatility.
@@ -21,9 +285,20 @@ class VolatilityModel:
         Initialize the volatility model.
         
         Args:
-            data_provider: Optional data provider instance
+            data_provider: Optional data provider instance. Its fetch_data is
+                called from worker threads, so it must be safe to call concurrently.
         """
-        self.data_provider = data_provider
+        self._data_provider = data_provider
+        
+        # Historical volatilities keyed by (index, start date, end date)
+        self._hist_vol_cache = {}
+        
+        # Spread volatilities and correlations keyed by (sorted pair, start date, end date)
+        self._spread_vol_cache = {}
+        self._correlation_cache = {}
+        
+        # Provider price series keyed by (index, start date, end date)
+        self._fetch_cache = {}
         
         # Default volatilities to use when historical data is not available
         self.default_volatilities = {
@@ -60,6 +335,33 @@ class VolatilityModel:
             }
         }
     
+    @property
+    def data_provider(self):
+        """
+        Data provider used for historical prices.
+        
+        Assigning a new provider drops the cached series and the statistics
+        derived from them, which belong to the previous provider.
+        """
+        return self._data_provider
+    
+    @data_provider.setter
+    def data_provider(self, data_provider):
+        self._data_provider = data_provider
+        self.clear_caches()
+    
+    def clear_caches(self):
+        """
+        Drop cached price history and the volatilities derived from it.
+        
+        Call this when the underlying data changes, e.g. after new prices
+        are loaded for an evaluation date that was already used.
+        """
+        self._fetch_cache.clear()
+        self._hist_vol_cache.clear()
+        self._spread_vol_cache.clear()
+        self._correlation_cache.clear()
+    
     def calculate_volatility(self, indices: List[str], 
                             evaluation_date: Union[str, datetime],
                             delivery_date: Union[str, datetime],
@@ -76,7 +378,10 @@ class VolatilityModel:
             forward_curves: Optional dictionary with forward curves
                 
         Returns:
-            Dict containing volatilities for all indices and their spreads
+            Dict containing volatilities for all indices and their spreads:
+            'individual', 'spreads', 'heston_params', 'spread_heston_params',
+            'correlations' (per spread, correlation of the two indices' daily
+            price changes, NaN if either is constant) and 'time_to_maturity'
         """
         # Convert dates if needed
         if isinstance(evaluation_date, str):
@@ -91,38 +396,64 @@ class VolatilityModel:
         # Calculate historical start date
         historical_start = evaluation_date - timedelta(days=historical_length)
         
-        # Fetch historical data for all indices
-        historical_data = {}
-        for index in indices:
-            try:
-                if self.data_provider:
-                    # Format dates for data provider
-                    start_date_str = historical_start.strftime('%Y-%m-%d')
-                    end_date_str = evaluation_date.strftime('%Y-%m-%d')
-                    
-                    # Fetch historical data
-                    historical_data[index] = self.data_provider.fetch_data(
-                        index, start_date_str, end_date_str)
-                else:
-                    # Mock data if no provider
-                    logger.warning(f"No data provider available, using mock data for {index}")
-                    dates = pd.date_range(start=historical_start, end=evaluation_date)
-                    historical_data[index] = pd.Series(
-                        np.random.normal(10, 0.5, len(dates)), index=dates)
-            except Exception as e:
-                logger.error(f"Error fetching historical data for {index}: {e}")
-                # Create mock data
-                dates = pd.date_range(start=historical_start, end=evaluation_date)
-                historical_data[index] = pd.Series(
-                    np.random.normal(10, 0.5, len(dates)), index=dates)
+        # Each index once, in the given order, so the panel columns match the positions below
+        indices = list(dict.fromkeys(indices))
+        if not indices:
+            return {
+                'individual': {},
+                'spreads': {},
+                'heston_params': {},
+                'spread_heston_params': {},
+                'correlations': {},
+                'time_to_maturity': time_to_maturity
+            }
+        
+        # Fetch historical data for all indices, overlapping the provider calls
+        with ThreadPoolExecutor(max_workers=_clip(len(indices), 1, 8)) as executor:
+            historical_data = dict(zip(indices, executor.map(
+                lambda index: self._fetch_history(index, historical_start, evaluation_date), indices)))
+        
+        # Align all series on the union of their dates once; each index takes
+        # its vol from its own prices and each pair from the dates where both
+        # have one, so a pair's results never depend on the other indices
+        panel = pd.concat(historical_data, axis=1).sort_index().to_numpy(dtype=np.float64)
+        has_price = ~np.isnan(panel)
+        
+        # Without gaps every pair shares all dates, and one covariance matrix
+        # serves all pairs; 5 prices is the minimum the historical helpers
+        # require of aligned data
+        has_common_history = panel.shape[0] >= 5 and bool(has_price.all())
+        
+        if has_common_history:
+            # One covariance matrix for all pairs, correlations scaled from it
+            price_changes = np.diff(panel, axis=0)
+            cov_matrix = np.atleast_2d(np.cov(price_changes, rowvar=False))
+            daily_vols = np.sqrt(np.diag(cov_matrix))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr_matrix = cov_matrix / daily_vols[:, None] / daily_vols[None, :]
+            np.clip(corr_matrix, -1, 1, out=corr_matrix)
         
         # Calculate individual volatilities and Heston parameters
         individual_vols = {}
         heston_params = {}
         
-        for index in indices:
-            # Calculate historical volatility first
-            vol = self.estimate_volatility_from_historical_data(historical_data[index])
+        for pos, index in enumerate(indices):
+            # Calculate historical volatility first, from the index's own
+            # prices in chronological order so a short index does not change
+            # the vols of the others
+            prices = panel[has_price[:, pos], pos]
+            if prices.size >= 5:
+                vol = self.estimate_volatility_from_historical_data(prices)
+            elif prices.size > 0:
+                # Too little history to estimate, a floored vol would only give
+                # a degenerate smile; the default is relative, so scale it by
+                # the last price to the normal vols of the other indices
+                logger.warning(f"Insufficient data for {index} volatility, using default")
+                vol = max(0.01, self.default_volatilities.get(index, 0.35) * abs(float(prices[-1])))
+            else:
+                # No price to scale the default by, keep the floored estimate
+                logger.warning(f"No historical data for {index}, using floored volatility")
+                vol = self.estimate_volatility_from_historical_data(prices)
             individual_vols[index] = vol
             
             # Calibrate Heston parameters based on historical data
@@ -132,148 +463,182 @@ class VolatilityModel:
         # Calculate spread volatilities and parameters
         spread_vols = {}
         spread_heston_params = {}
+        correlations = {}
         
         if len(indices) > 1:
-            for i, index1 in enumerate(indices):
-                for j, index2 in enumerate(indices):
-                    if i < j:  # Avoid duplicate pairs and self-pairs
-                        spread_name = f"{index1}-{index2}"
+            # Fallback spread vols for every pair at once, assuming a correlation of 0.5
+            vols_arr = np.array([individual_vols[index] for index in indices])
+            fallback_spread_vols = np.sqrt(vols_arr[:, None]**2 + vols_arr[None, :]**2
+                                           - vols_arr[:, None] * vols_arr[None, :])
+            
+            if has_common_history:
+                # Spread vols for every pair from the covariance matrix,
+                # var(a - b) = var(a) + var(b) - 2 cov(a, b)
+                variances = np.diag(cov_matrix)
+                spread_vars = variances[:, None] + variances[None, :] - 2 * cov_matrix
+                pair_spread_vols = np.sqrt(np.maximum(spread_vars, 0.0)) * _SQRT_252
+                np.fmax(pair_spread_vols, 0.01, out=pair_spread_vols)
+            
+            for (i, index1), (j, index2) in combinations(enumerate(indices), 2):
+                spread_name = f"{index1}-{index2}"
+                
+                try:
+                    if has_common_history:
+                        spread_vol = float(pair_spread_vols[i, j])
+                        correlation = float(corr_matrix[i, j])
+                    else:
+                        # The panel has gaps, use the dates of this pair only
+                        pair_dates = has_price[:, i] & has_price[:, j]
+                        prices1, prices2 = panel[pair_dates, i], panel[pair_dates, j]
                         
-                        try:
-                            # Align the series on matching dates
-                            aligned_data = pd.DataFrame({
-                                'asset1': historical_data[index1],
-                                'asset2': historical_data[index2]
-                            }).dropna()
-                            
-                            # Calculate the spread series
-                            spread_series = aligned_data['asset1'] - aligned_data['asset2']
-                            
-                            # Calculate volatility of the spread
-                            spread_vol = self.estimate_volatility_from_historical_data(spread_series)
-                            spread_vols[spread_name] = spread_vol
-                            
-                            # Calculate correlation between the two assets
-                            correlation = aligned_data['asset1'].corr(aligned_data['asset2'])
-                            
-                            # Calibrate Heston parameters for the spread
-                            spread_params = self.calibrate_spread_heston_parameters(
-                                index1, index2, spread_vol, correlation, heston_params, time_to_maturity)
-                            
-                            spread_heston_params[spread_name] = spread_params
-                            
-                        except Exception as e:
-                            logger.error(f"Error calculating spread vol for {spread_name}: {e}")
-                            # Use a simple approximation based on individual vols
-                            vol1 = individual_vols[index1]
-                            vol2 = individual_vols[index2]
-                            # Assume correlation of 0.5 as fallback
-                            corr = 0.5
-                            spread_vol = np.sqrt(vol1**2 + vol2**2 - 2 * corr * vol1 * vol2)
-                            spread_vols[spread_name] = spread_vol
-                            
-                            # Use default spread Heston parameters
-                            spread_heston_params[spread_name] = self.default_heston_params['default']
+                        if prices1.size < 5:
+                            logger.warning(f"Insufficient aligned data for {spread_name}, using fallback")
+                            spread_vol = float(fallback_spread_vols[i, j])
+                        else:
+                            spread_vol = self.estimate_volatility_from_historical_data(prices1 - prices2)
+                        # Correlation of daily price changes, as on the covariance path
+                        correlation = (_pearson(np.diff(prices1), np.diff(prices2))
+                                       if prices1.size > 2 else float('nan'))
+                    
+                    spread_vols[spread_name] = spread_vol
+                    correlations[spread_name] = correlation
+                    
+                    # Calibrate Heston parameters for the spread
+                    spread_params = self.calibrate_spread_parameters(
+                        spread_name, spread_vol, time_to_maturity)
+                    
+                    spread_heston_params[spread_name] = spread_params
+                    
+                except (ValueError, TypeError, ArithmeticError) as e:
+                    logger.error(f"Error calculating spread vol for {spread_name}: {e}")
+                    # Use a simple approximation based on individual vols
+                    spread_vol = float(fallback_spread_vols[i, j])
+                    spread_vols[spread_name] = spread_vol
+                    
+                    # Use default spread Heston parameters, copied so callers
+                    # cannot modify the model's defaults through the result
+                    spread_heston_params[spread_name] = dict(self.default_heston_params['default'])
         
         return {
             'individual': individual_vols,
             'spreads': spread_vols,
             'heston_params': heston_params,
             'spread_heston_params': spread_heston_params,
+            'correlations': correlations,
             'time_to_maturity': time_to_maturity
         }
     
-    def estimate_volatility_from_historical_data(self, price_series: pd.Series) -> float:
+    def _fetch_data(self, index, start_date_str, end_date_str):
         """
-        Calculate historical volatility from price series.
+        Fetch a price series from the data provider, reusing earlier fetches.
+        
+        The historical vol, spread vol and correlation helpers request the
+        same series for the same window, so each one is fetched only once.
+        Callers must not modify the returned series.
+        
+        Args:
+            index: Index name
+            start_date_str: Start date as YYYY-MM-DD
+            end_date_str: End date as YYYY-MM-DD
+            
+        Returns:
+            pd.Series: Prices indexed by date
+        """
+        cache_key = (index, start_date_str, end_date_str)
+        if cache_key not in self._fetch_cache:
+            self._fetch_cache[cache_key] = self.data_provider.fetch_data(index, start_date_str, end_date_str)
+        return self._fetch_cache[cache_key]
+    
+    def _fetch_history(self, index, start_date, end_date):
+        """
+        Fetch the price history of an index, falling back to mock data.
         
         Args:
-            price_series: Historical price series
+            index: Index name
+            start_date: First date of the history
+            end_date: Last date of the history
             
+        Returns:
+            pd.Series: Prices indexed by date
+        """
+        # Mock data if no provider
+        if not self.data_provider:
+            logger.warning(f"No data provider available, using mock data for {index}")
+            return _mock_price_series(index, start_date, end_date)
+        
+        try:
+            # Format dates for data provider
+            start_date_str = start_date.strftime('%Y-%m-%d')
+            end_date_str = end_date.strftime('%Y-%m-%d')
+            
+            # Fetch historical data, keeping the last price of a repeated date
+            # so the series can be aligned with the other indices
+            price_series = self._fetch_data(index, start_date_str, end_date_str)
+            if not price_series.index.is_unique:
+                price_series = price_series[~price_series.index.duplicated(keep='last')]
+            return price_series
+        except Exception as e:
+            logger.error(f"Error fetching historical data for {index}: {e}")
+            # Create mock data
+            return _mock_price_series(index, start_date, end_date)
+    
+    def estimate_volatility_from_historical_data(self, price_series: Union[pd.Series, np.ndarray]) -> float:
+        """
+        Calculate historical volatility from price series.
+        
+        Uses absolute price changes (normal model) rather than log returns, so
+        spread series that cross zero are handled. Arrays skip all pandas work.
+        
+        Args:
+            price_series: Historical price series, or an array of prices
+                already in chronological order
+        
         Returns:
             float: Estimated annualized volatility
         """
-        # Ensure data is sorted chronologically
-        price_series = price_series.sort_index()
+        if isinstance(price_series, pd.Series):
+            # Ensure data is sorted chronologically
+            if not price_series.index.is_monotonic_increasing:
+                price_series = price_series.sort_index()
+            prices = price_series.to_numpy(dtype=np.float64)
+        else:
+            prices = np.asarray(price_series, dtype=np.float64)
+        
+        if NUMBA_AVAILABLE:
+            # Single compiled pass over the prices, no temporary arrays
+            annualized_vol = ann_vol_from_prices(prices)
+            return 0.01 if math.isnan(annualized_vol) else max(0.01, annualized_vol)
         
         # For normal model, use absolute price changes
-        price_changes = price_series.diff().dropna()
+        price_changes = np.diff(prices)
+        price_changes = price_changes[~np.isnan(price_changes)]
+        
+        if price_changes.size < 2:
+            return 0.01
         
         # Calculate daily volatility (standard deviation of changes)
-        daily_vol = price_changes.std()
+        daily_vol = price_changes.std(ddof=1)
         
         # Annualize (assuming 252 trading days)
-        annualized_vol = daily_vol * np.sqrt(252)
+        annualized_vol = daily_vol * _SQRT_252
         
         # Ensure minimum volatility
-        return max(0.01, annualized_vol)
+        return max(0.01, float(annualized_vol))
     
     def calibrate_heston_parameters(self, index, base_vol, time_to_maturity):
         """
         Calibrate Heston model parameters for stronger volatility smile.
         """
-        print(f"DEBUG - calibrate_heston_parameters for {index}: base_vol={base_vol}, time={time_to_maturity}")
-        
-        # Convert from percentage (31%) to decimal (0.31) for Heston calculations
-        decimal_vol = base_vol / 100.0
-        print(f"DEBUG - Converting from percentage vol {base_vol}% to decimal {decimal_vol}")
-        
-        # Initial variance (v0) is square of volatility decimal
-        v0 = decimal_vol**2
-        print(f"DEBUG - v0 (initial variance): {v0}")
-        
-        # CRITICAL SMILE ENHANCEMENT
-        
-        # 1. Kappa (mean reversion speed)
-        # - Force kappa to be small enough to create stronger smile
-        # - Recommended range for visible smile: 0.1-0.8
-        # - Ignore time_to_maturity formula that creates too high values
-        kappa = 0.5  # Fixed value that works well for commodity smiles
-        print(f"DEBUG - Fixed kappa (mean reversion): {kappa}")
-        
-        # 2. Theta (long-run variance)
-        # - Keep theta = v0 for short maturities
-        theta = v0
-        print(f"DEBUG - theta (long-run variance): {theta}")
-        
-        # 3. Sigma (volatility of volatility)
-        # - Critical for smile curvature
-        # - Need sigma large enough relative to kappa
-        # - sigma/kappa ratio determines curvature magnitude
-        # - Target ratio of 1.0-2.0 for pronounced smile
-        
-        # Calculate sigma to achieve desired sigma/kappa ratio
-        sigma_kappa_ratio = 1.5  # Target ratio for strong curvature
-        sigma = kappa * sigma_kappa_ratio  # Ensure sigma is proportionally large enough
-        print(f"DEBUG - sigma (vol-of-vol) set for ratio {sigma_kappa_ratio}: {sigma}")
-        
-        # 4. Rho (correlation)
-        # - Controls smile asymmetry (skew)
-        # - More negative = steeper downward slope on right side
-        # - For commodity markets: usually -0.3 to -0.8
-        
-        # Different rho for different product types
-        if "spread" in index.lower() or "-" in index:
-            # Spread options typically have more pronounced skew
-            rho = -0.7
-        else:
-            # Outright options
-            rho = -0.6
+        v0, kappa, theta, sigma, rho = _calibrate_heston_cached(index, base_vol, time_to_maturity)
         
-        print(f"DEBUG - Fixed rho (correlation): {rho}")
-        
-        # Build parameters dict
-        result = {
+        # Build a fresh parameters dict so callers never share cached state
+        return {
             'v0': v0,
             'kappa': kappa,
             'theta': theta,
             'sigma': sigma,
             'rho': rho
         }
-        
-        print(f"DEBUG - Final calibrated Heston params for {index}: {result}")
-        
-        return result
     
     def get_volatility_surface(self, indices: List[str],
                             evaluation_date: Union[str, datetime],
@@ -282,9 +647,16 @@ class VolatilityModel:
                             option_strikes: Optional[Dict[str, float]] = None,
                             option_type: str = "call",
                             time_to_maturity: Optional[float] = None,
-                            forward_curves: Optional[Dict] = None) -> Dict[str, List[Dict[str, float]]]:
+                            forward_curves: Optional[Dict] = None,
+                            columnar: bool = False) -> Dict[str, Union[List[Dict[str, float]], Dict]]:
         """
         Generate complete volatility surface data with proper debugging.
+        
+        By default each smile is a list of point dicts. With columnar=True each
+        smile is instead a dict of NumPy arrays keyed like the points (with a
+        scalar time_to_maturity), which skips building per-point Python objects;
+        strike arrays may be shared and are read-only. surface_to_records
+        converts such a surface when records are needed.
         """
         try:
             # Parse dates and calculate time to maturity if not provided
@@ -298,6 +670,7 @@ class VolatilityModel:
                 time_to_maturity = days_to_delivery / 365.0
             
             time_to_maturity = max(0.01, time_to_maturity)
+            is_call = _is_call(option_type)
             logger.info(f"Generating volatility surface with time_to_maturity: {time_to_maturity} years")
             
             # Ensure we have base prices
@@ -307,183 +680,34 @@ class VolatilityModel:
             else:
                 logger.info(f"Using provided base prices: {base_prices}")
             
-            # Generate volatility smiles for each index and spread
+            # Independent pieces of the surface are built concurrently; history
+            # fetches block on the data provider, so threads overlap that I/O
             result = {}
-            
-            # Process individual indices first
-            for index in indices:
-                # Step 1: Get historical data and calculate base volatility
-                historical_vol = self._get_historical_volatility(index, evaluation_date)
-                logger.info(f"Historical volatility for {index}: {historical_vol:.4f}")
-                
-                # Step 2: Get forward value for the index
-                forward_value = base_prices.get(index, 10.0)
-                logger.info(f"Forward value for {index}: {forward_value:.4f}")
-                
-                # Step 3: Generate price range around forward (±50%)
-                min_price = forward_value * 0.5
-                max_price = forward_value * 1.5
-                
-                # Generate points with higher density near ATM
-                price_points = self._generate_price_points(forward_value, min_price, max_price, 100)
+            with ThreadPoolExecutor(max_workers=_clip(len(indices), 1, 8)) as executor:
+                # Historical volatility and Heston parameters per index, computed once
+                hist_vols = dict(zip(indices, executor.map(
+                    lambda index: self._get_historical_volatility(index, evaluation_date), indices)))
+                heston_cache = {index: self.calibrate_heston_parameters(index, hist_vols[index], time_to_maturity)
+                                for index in indices}
                 
-                # Step 4: Calculate Heston parameters based on historical vol
-                heston_params = self.calibrate_heston_parameters(index, historical_vol, time_to_maturity)
+                # Process individual indices first
+                evaluate_smile = self._specialize_smile(time_to_maturity, is_call)
+                for index, smile_data in executor.map(
+                        lambda index: self._build_index_smile(index, hist_vols[index], heston_cache[index],
+                                                              base_prices, time_to_maturity, evaluate_smile),
+                        indices):
+                    result[index] = smile_data
                 
-                # Step 5: Generate volatility smile data points with detailed logging
-                smile_data = []
-                for price in price_points:
-                    # Calculate moneyness (K/F)
-                    moneyness = price / forward_value
-                    
-                    # Calculate Heston implied vol (as percentage)
-                    percentage_vol_decimal = self.heston_implied_vol(moneyness, time_to_maturity, heston_params, option_type)
-                    
-                    # Convert to normal vol
-                    normal_vol = percentage_vol_decimal * forward_value
-                    
-                    # Calculate delta at this point
-                    delta = self._calculate_bachelier_delta(forward_value, price, time_to_maturity, normal_vol, option_type)
-                    
-                    # Log detailed information for key price points
-                    if abs(price - forward_value) < 0.01 or price == min_price or price == max_price:
-                        logger.info(f"Key price point for {index}: price={price:.4f}, moneyness={moneyness:.4f}, "
-                                    f"percentage_vol={percentage_vol_decimal:.4f}, normal_vol={normal_vol:.4f}")
-                    
-                    # Add data point to smile
-                    smile_data.append({
-                        'strike': float(price),
-                        'volatility': float(normal_vol),
-                        'percentage_vol': float(percentage_vol_decimal * 100),  # Convert to percentage
-                        'delta': float(delta),
-                        'relative_strike': float(((price / forward_value) - 1) * 100),  # Relative to forward in %
-                        'time_to_maturity': float(time_to_maturity)
-                    })
-                
-                # Sort by strike
-                smile_data.sort(key=lambda x: x['strike'])
-                logger.info(f"Generated {len(smile_data)} volatility points for {index}")
-                
-                # Log a summary of the volatility range
-                if smile_data:
-                    min_vol = min(p['volatility'] for p in smile_data)
-                    max_vol = max(p['volatility'] for p in smile_data)
-                    atm_vol = next((p['volatility'] for p in smile_data if abs(p['strike'] - forward_value) < 0.01), None)
-                    logger.info(f"Volatility range for {index}: min={min_vol:.4f}, max={max_vol:.4f}, atm={atm_vol:.4f}")
-                
-                # Store in result
-                result[index] = smile_data
-            
-            # Process spreads with additional debugging and improvements
-            if len(indices) > 1:
-                for i, index1 in enumerate(indices):
-                    for j, index2 in enumerate(indices):
-                        if i < j:  # Avoid duplicate pairs
-                            spread_name = f"{index1}-{index2}"
-                            
-                            # Get historical data for spread
-                            spread_vol = self._get_historical_spread_volatility(index1, index2, evaluation_date)
-                            logger.info(f"Historical volatility for {spread_name}: {spread_vol:.4f}")
-                            
-                            # Get forward value for spread
-                            spread_forward = base_prices.get(spread_name, 
-                                                            base_prices.get(index1, 10.0) - 
-                                                            base_prices.get(index2, 9.0))
-                            logger.info(f"Forward spread value for {spread_name}: {spread_forward:.4f}")
-                            
-                            # CRITICAL FIX: Special handling for near-zero spreads
-                            # For spread options, we work in normal volatility space rather than percentage
-                            # This avoids the division by near-zero spreads
-                            
-                            # Step 1: Calibrate parameters using normal volatility directly
-                            # For spread options, we use the absolute volatility in parameter calibration
-                            absolute_vol = spread_vol  # Keep as percentage for parameter calibration
-                            heston_params = self.calibrate_spread_parameters(spread_name, absolute_vol, time_to_maturity)
-                            
-                            # Step 2: Generate spread range with appropriate points
-                            # Ensure adequate coverage around ATM and zero
-                            min_spread = min(-0.5, spread_forward - max(0.5, abs(spread_forward)))
-                            max_spread = max(0.5, spread_forward + max(0.5, abs(spread_forward)))
-                            
-                            # Generate points with higher density near ATM and near 0
-                            spread_points = self._generate_spread_points(spread_forward, min_spread, max_spread, 100)
-                            
-                            # Step 3: Generate smile data points for spread
-                            spread_smile = []
-                            for spread in spread_points:
-                                # CRITICAL FIX: Handle moneyness calculation for near-zero spreads
-                                # Traditional moneyness (K/F) breaks down when F approaches zero
-                                
-                                if abs(spread_forward) < 0.01:
-                                    # For near-zero forward spreads, use absolute distance
-                                    # normalized by a reference value (0.1 is a reasonable scale)
-                                    moneyness = 1.0 + (spread - spread_forward) / 0.1
-                                else:
-                                    # For non-zero spreads, use standard moneyness
-                                    moneyness = spread / spread_forward
-                                
-                                # Log specific issues with moneyness calculation
-                                if not np.isfinite(moneyness) or moneyness <= 0:
-                                    logger.warning(f"Invalid moneyness calculated: {moneyness} (spread={spread}, forward={spread_forward})")
-                                    moneyness = 1.0  # Use safe default
-                                
-                                # CRITICAL FIX: Use modified approach for volatility calculation
-                                if abs(spread_forward) < 0.01:
-                                    # For near-zero spreads, work directly with normal volatility
-                                    # Use a base normal vol and adjust based on distance from ATM
-                                    base_normal_vol = spread_vol / 100.0  # Convert from percentage to decimal
-                                    
-                                    # Calculate normal vol directly with adjustment for distance from ATM
-                                    # Higher vol for strikes further from ATM (quadratic shape)
-                                    distance_from_atm = abs(spread - spread_forward)
-                                    atm_adj_factor = 1.0 + (distance_from_atm * distance_from_atm * 2.0)
-                                    normal_vol = base_normal_vol * atm_adj_factor
-                                    
-                                    # Calculate implied percentage vol (for display purposes only)
-                                    # Use a reference value to avoid division by zero or tiny numbers
-                                    reference_value = max(0.1, abs(spread_forward))
-                                    percentage_vol = normal_vol / reference_value
-                                else:
-                                    # For regular spreads, use the Heston model
-                                    percentage_vol = self.heston_implied_vol(moneyness, time_to_maturity, heston_params, option_type)
-                                    
-                                    # Convert to normal vol
-                                    normal_vol = percentage_vol * abs(spread_forward)
-                                
-                                # Calculate delta (use standard Bachelier formula)
-                                delta = self._calculate_bachelier_delta(spread_forward, spread, time_to_maturity, normal_vol, option_type)
-                                
-                                # Log key points for debugging
-                                if abs(spread - spread_forward) < 0.01 or abs(spread) < 0.01 or spread == min_spread or spread == max_spread:
-                                    logger.info(f"Key spread point: spread={spread:.4f}, moneyness={moneyness:.4f}, " 
-                                            f"percentage_vol={percentage_vol*100:.4f}, normal_vol={normal_vol:.4f}")
-                                
-                                # Add data point to smile
-                                spread_smile.append({
-                                    'strike': float(spread),
-                                    'volatility': float(normal_vol),
-                                    'percentage_vol': float(percentage_vol * 100),  # Convert to percentage
-                                    'delta': float(delta),
-                                    'relative_strike': float(((spread - spread_forward) / max(0.1, abs(spread_forward))) * 100),
-                                    'time_to_maturity': float(time_to_maturity)
-                                })
-                            
-                            # Sort by strike
-                            spread_smile.sort(key=lambda x: x['strike'])
-                            logger.info(f"Generated {len(spread_smile)} volatility points for {spread_name}")
-                            
-                            # Store in result
-                            result[spread_name] = spread_smile
-                            
-                            # If we have an option strike, log the volatility at that point
-                            if option_strikes and spread_name in option_strikes:
-                                strike = option_strikes[spread_name]
-                                # Find closest strike
-                                closest_point = min(spread_smile, key=lambda x: abs(x['strike'] - strike))
-                                logger.info(f"For strike {strike:.4f}, closest volatility point: {closest_point}")
+                # Process spreads with additional debugging and improvements
+                if len(indices) > 1:
+                    for spread_name, spread_smile in executor.map(
+                            lambda pair: self._build_spread_smile(pair[0], pair[1], base_prices, evaluation_date,
+                                                                 time_to_maturity, is_call, option_strikes),
+                            combinations(indices, 2)):
+                        result[spread_name] = spread_smile
             
             logger.info(f"Volatility surface generation complete with {len(result)} keys: {list(result.keys())}")
-            return result
+            return result if columnar else self.surface_to_records(result)
         
         except Exception as e:
             logger.error(f"Error generating volatility surface: {e}")
@@ -491,46 +715,311 @@ class VolatilityModel:
             logger.error(traceback.format_exc())
             
             # Return a minimal fallback surface
-            return self._generate_fallback_volatility_surface(indices, base_prices)
+            return self._generate_fallback_volatility_surface(indices, base_prices, columnar)
     
-    def _generate_price_points(self, forward, min_price, max_price, num_points=100):
+    def _build_index_smile(self, index, historical_vol, heston_params, base_prices, time_to_maturity, evaluate_smile):
         """
-        Generate price points with higher density around ATM (forward value).
+        Build the volatility smile of a single index.
         
         Args:
-            forward: Forward price
-            min_price: Minimum price
-            max_price: Maximum price
-            num_points: Number of points to generate
+            index: Index name
+            historical_vol: Historical volatility of the index
+            heston_params: Heston parameters calibrated for the index
+            base_prices: Dictionary of forward prices by index
+            time_to_maturity: Time to maturity in years
+            evaluate_smile: Smile evaluator from _specialize_smile
             
         Returns:
-            numpy array: Generated price points
+            tuple: (index, smile columns sorted by strike)
+        """
+        logger.info(f"Historical volatility for {index}: {historical_vol:.4f}")
+        
+        # Step 1: Get forward value for the index
+        forward_value = base_prices.get(index, 10.0)
+        logger.info(f"Forward value for {index}: {forward_value:.4f}")
+        
+        # Step 2: Generate price range around forward (±50%)
+        min_price = forward_value * 0.5
+        max_price = forward_value * 1.5
+        
+        # Generate points with higher density near ATM
+        price_points = self._generate_price_points(forward_value, min_price, max_price, 100)
+        
+        # Step 3: Generate volatility smile columns in one vectorized pass
+        strikes = np.asarray(price_points, dtype=np.float64)
+        percentage_vols, normal_vols, deltas = evaluate_smile(forward_value, strikes,
+                                                              _unpack_heston_params(heston_params))
+        
+        # Log detailed information for key price points (ATM and range ends)
+        if logger.isEnabledFor(logging.DEBUG):
+            is_key_point = ((np.abs(strikes - forward_value) < 0.01) |
+                            (strikes == min_price) | (strikes == max_price))
+            for k in np.flatnonzero(is_key_point):
+                logger.debug("Key price point for %s: price=%.4f, moneyness=%.4f, percentage_vol=%.4f, normal_vol=%.4f",
+                             index, strikes[k], strikes[k] / forward_value, percentage_vols[k], normal_vols[k])
+        
+        # Sort by strike
+        smile_data = self._sort_smile({
+            'strike': strikes,
+            'volatility': normal_vols,
+            'percentage_vol': percentage_vols * 100,  # Convert to percentage
+            'delta': deltas,
+            'relative_strike': ((strikes / forward_value) - 1) * 100,  # Relative to forward in %
+            'time_to_maturity': float(time_to_maturity)
+        })
+        logger.info(f"Generated {strikes.size} volatility points for {index}")
+        
+        # Log a summary of the volatility range
+        if strikes.size:
+            atm_mask = np.abs(smile_data['strike'] - forward_value) < 0.01
+            atm_vol = smile_data['volatility'][atm_mask][0] if atm_mask.any() else None
+            logger.info(f"Volatility range for {index}: min={normal_vols.min():.4f}, max={normal_vols.max():.4f}, atm={atm_vol:.4f}")
+        
+        return index, smile_data
+    
+    def _build_spread_smile(self, index1, index2, base_prices, evaluation_date, time_to_maturity, is_call,
+                            option_strikes=None):
         """
-        # Create denser points near ATM
-        # Use a combination of uniform and normal distributions
+        Build the volatility smile of the spread between two indices.
         
-        # Uniform distribution for coverage across the entire range
-        uniform_points = np.linspace(min_price, max_price, num_points // 2)
+        Args:
+            index1: First index name
+            index2: Second index name
+            base_prices: Dictionary of forward prices by index or spread
+            evaluation_date: Date for historical data lookup
+            time_to_maturity: Time to maturity in years
+            is_call: True for calls, False for puts
+            option_strikes: Optional dictionary of option strikes by spread name
+            
+        Returns:
+            tuple: (spread name, smile columns sorted by strike)
+        """
+        spread_name = f"{index1}-{index2}"
+        
+        # Get historical data for spread
+        spread_vol = self._get_historical_spread_volatility(index1, index2, evaluation_date)
+        logger.info(f"Historical volatility for {spread_name}: {spread_vol:.4f}")
+        
+        # Get forward value for spread
+        if spread_name in base_prices:
+            spread_forward = base_prices[spread_name]
+        else:
+            spread_forward = base_prices.get(index1, 10.0) - base_prices.get(index2, 9.0)
+        logger.info(f"Forward spread value for {spread_name}: {spread_forward:.4f}")
+        
+        # CRITICAL FIX: Special handling for near-zero spreads
+        # For spread options, we work in normal volatility space rather than percentage
+        # This avoids the division by near-zero spreads
+        
+        # Step 1: Calibrate parameters using normal volatility directly
+        # For spread options, we use the absolute volatility in parameter calibration
+        absolute_vol = spread_vol  # Keep as percentage for parameter calibration
+        heston_params = self.calibrate_spread_parameters(spread_name, absolute_vol, time_to_maturity)
+        heston_values = _unpack_heston_params(heston_params)
+        
+        # Step 2: Generate spread range with appropriate points
+        # Ensure adequate coverage around ATM and zero
+        min_spread = min(-0.5, spread_forward - max(0.5, abs(spread_forward)))
+        max_spread = max(0.5, spread_forward + max(0.5, abs(spread_forward)))
+        
+        # Generate points with higher density near ATM and near 0
+        spread_points = self._generate_spread_points(spread_forward, min_spread, max_spread, 100)
+        
+        # Step 3: Generate smile columns for the spread in one vectorized pass
+        spread_strikes = np.asarray(spread_points, dtype=np.float64)
+        near_zero_forward = abs(spread_forward) < 0.01
+        
+        # CRITICAL FIX: Handle moneyness calculation for near-zero spreads
+        # Traditional moneyness (K/F) breaks down when F approaches zero
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if near_zero_forward:
+                # For near-zero forward spreads, use absolute distance
+                # normalized by a reference value (0.1 is a reasonable scale)
+                moneyness = 1.0 + (spread_strikes - spread_forward) / 0.1
+            else:
+                # For non-zero spreads, use standard moneyness
+                moneyness = spread_strikes / spread_forward
+        
+        # Log specific issues with moneyness calculation
+        invalid = ~np.isfinite(moneyness) | (moneyness <= 0)
+        if invalid.any():
+            logger.warning(f"Invalid moneyness for {np.count_nonzero(invalid)} strikes of {spread_name} "
+                           f"(forward={spread_forward}), using 1.0")
+            moneyness = np.where(invalid, 1.0, moneyness)  # Use safe default
+        
+        # CRITICAL FIX: Use modified approach for volatility calculation
+        if near_zero_forward:
+            # For near-zero spreads, work directly with normal volatility
+            # Use a base normal vol and adjust based on distance from ATM
+            base_normal_vol = spread_vol / 100.0  # Convert from percentage to decimal
+            
+            # Calculate normal vol directly with adjustment for distance from ATM
+            # Higher vol for strikes further from ATM (quadratic shape)
+            distance_from_atm = np.abs(spread_strikes - spread_forward)
+            spread_normal_vols = base_normal_vol * (1.0 + (distance_from_atm * distance_from_atm * 2.0))
+            
+            # Calculate implied percentage vol (for display purposes only)
+            # Use a reference value to avoid division by zero or tiny numbers
+            spread_pct_vols = spread_normal_vols / max(0.1, abs(spread_forward))
+        else:
+            # For regular spreads, use the Heston model and convert to normal vol
+            spread_pct_vols = self.heston_implied_vol(moneyness, time_to_maturity, heston_values)
+            spread_normal_vols = spread_pct_vols * abs(spread_forward)
+        
+        # Calculate delta (use standard Bachelier formula)
+        spread_deltas = self._bachelier_delta_vec(spread_forward, spread_strikes, time_to_maturity,
+                                                  spread_normal_vols, is_call)
+        
+        # Log key spread points (ATM, zero and range ends) for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            is_key_point = ((np.abs(spread_strikes - spread_forward) < 0.01) |
+                            (np.abs(spread_strikes) < 0.01) |
+                            (spread_strikes == min_spread) | (spread_strikes == max_spread))
+            for k in np.flatnonzero(is_key_point):
+                logger.debug("Key spread point: spread=%.4f, moneyness=%.4f, percentage_vol=%.4f, normal_vol=%.4f",
+                             spread_strikes[k], moneyness[k], spread_pct_vols[k] * 100, spread_normal_vols[k])
+        
+        # Sort by strike
+        spread_smile = self._sort_smile({
+            'strike': spread_strikes,
+            'volatility': spread_normal_vols,
+            'percentage_vol': spread_pct_vols * 100,  # Convert to percentage
+            'delta': spread_deltas,
+            'relative_strike': ((spread_strikes - spread_forward) / max(0.1, abs(spread_forward))) * 100,
+            'time_to_maturity': float(time_to_maturity)
+        })
+        logger.info(f"Generated {spread_strikes.size} volatility points for {spread_name}")
+        
+        # If we have an option strike, log the volatility at that point
+        if option_strikes and spread_name in option_strikes:
+            strike = option_strikes[spread_name]
+            # Find closest strike
+            closest = int(np.argmin(np.abs(spread_smile['strike'] - strike)))
+            closest_point = {key: np.broadcast_to(values, spread_strikes.shape)[closest].item()
+                             for key, values in spread_smile.items()}
+            logger.info(f"For strike {strike:.4f}, closest volatility point: {closest_point}")
+        
+        return spread_name, spread_smile
+    
+    @staticmethod
+    def _specialize_smile(time_to_maturity, is_call):
+        """
+        Build a smile evaluator specialized for one maturity and option type.
         
-        # Normal distribution around ATM for higher density
-        normal_std = (max_price - min_price) * 0.15  # 15% of range
-        normal_points = np.random.normal(forward, normal_std, num_points // 2)
-        normal_points = np.clip(normal_points, min_price, max_price)
+        The option type and time scaling are fixed for a whole surface, so they
+        are resolved once here rather than per strike. The evaluator runs the
+        fused heston_smile kernel when Numba is installed and NumPy otherwise.
         
-        # Combine both distributions
-        all_points = np.concatenate([uniform_points, normal_points])
+        Args:
+            time_to_maturity: Time to maturity in years
+            is_call: True for calls, False for puts
+            
+        Returns:
+            callable: evaluate(forward, strikes, heston_values) returning the
+                percentage vols (decimal), normal vols and Bachelier deltas
+        """
+        sqrt_t = math.sqrt(time_to_maturity)
+        atm_delta = 0.5 if is_call else -0.5
         
-        # Add key moneyness points
-        for moneyness in [0.7, 0.8, 0.9, 0.95, 0.975, 0.99, 1.0, 1.01, 1.025, 1.05, 1.1, 1.2, 1.3]:
-            all_points = np.append(all_points, forward * moneyness)
+        def evaluate(forward, strikes, heston_values):
+            v0, kappa, theta, sigma, rho = heston_values
+            
+            # Fused compiled kernel when Numba is available
+            if NUMBA_AVAILABLE:
+                return heston_smile(float(forward), strikes, sqrt_t, float(v0), float(kappa),
+                                    float(sigma), float(rho), is_call)
+            
+            # Heston implied vol
+            with np.errstate(divide='ignore', invalid='ignore'):
+                moneyness = strikes / forward
+            percentage_vols = VolatilityModel._heston_implied_vol_vec(moneyness, heston_values)
+            
+            # Normal vol and Bachelier delta
+            normal_vols = percentage_vols * forward
+            degenerate = normal_vols <= 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                d = (forward - strikes) / (normal_vols * sqrt_t)
+            deltas = ndtr(d) if is_call else ndtr(d) - 1
+            if degenerate.any():
+                # Zero volatility: delta is the intrinsic exercise indicator
+                in_the_money = (strikes < forward) if is_call else (strikes > forward)
+                intrinsic = np.where(np.abs(forward - strikes) < 0.0001, atm_delta,
+                                     np.where(in_the_money, 1.0 if is_call else -1.0, 0.0))
+                deltas = np.where(degenerate, intrinsic, deltas)
+            
+            return percentage_vols, normal_vols, deltas
         
-        # Add exact forward point
-        all_points = np.append(all_points, forward)
+        return evaluate
+    
+    @staticmethod
+    def _sort_smile(smile):
+        """
+        Sort all array columns of a smile by strike.
         
-        # Sort and remove duplicates
-        result = np.sort(np.unique(all_points))
+        Args:
+            smile: Dict of smile columns, scalar entries are left untouched
+            
+        Returns:
+            dict: Smile columns ordered by strike
+        """
+        # Point generators already return sorted strikes, check before sorting
+        strikes = smile['strike']
+        if np.all(strikes[1:] >= strikes[:-1]):
+            return smile
+        
+        order = np.argsort(strikes, kind='stable')
+        return {key: values[order] if isinstance(values, np.ndarray) else values
+                for key, values in smile.items()}
+    
+    @staticmethod
+    def surface_to_records(surface):
+        """
+        Convert a columnar surface into the list-of-points form.
         
-        return result
+        Args:
+            surface: Dict of smiles as returned by get_volatility_surface
+                with columnar=True
+            
+        Returns:
+            dict: Smile name to list of point dicts
+        """
+        return {name: VolatilityModel._to_points(smile) for name, smile in surface.items()}
+    
+    @staticmethod
+    def _to_points(smile):
+        """
+        Convert a columnar smile into the list of point dicts returned to callers.
+        
+        Args:
+            smile: Dict of smile columns, scalar entries are repeated for every point
+            
+        Returns:
+            list: One dict per strike
+        """
+        # Zipping tolist() columns is several times faster than building a
+        # DataFrame and calling to_dict('records') for ~100-point smiles, and
+        # yields native floats without per-value casts
+        keys = list(smile.keys())
+        size = len(smile['strike'])
+        columns = [values.tolist() if isinstance(values, np.ndarray) else [values] * size
+                   for values in smile.values()]
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+    
+    def _generate_price_points(self, forward, min_price, max_price, num_points=100):
+        """
+        Generate price points with higher density around ATM (forward value).
+        
+        Args:
+            forward: Forward price
+            min_price: Minimum price
+            max_price: Maximum price
+            num_points: Number of points to generate
+            
+        Returns:
+            numpy array: Generated price points, shared and read-only
+        """
+        # Grids depend only on these inputs, so repeated surfaces reuse them
+        return _price_grid(float(forward), float(min_price), float(max_price), int(num_points))
     
     def _generate_spread_points(self, forward, min_spread, max_spread, num_points=100):
         """
@@ -543,70 +1032,45 @@ class VolatilityModel:
             num_points: Number of points to generate
             
         Returns:
-            numpy array: Generated spread points
+            numpy array: Generated spread points, shared and read-only
         """
-        # Create denser points near ATM and zero
-        # Use a combination of uniform and two normal distributions
-        
-        # Uniform distribution for coverage across the entire range
-        uniform_points = np.linspace(min_spread, max_spread, num_points // 3)
-        
-        # Normal distribution around ATM for higher density
-        normal_std = (max_spread - min_spread) * 0.15  # 15% of range
-        normal_points_atm = np.random.normal(forward, normal_std, num_points // 3)
-        normal_points_atm = np.clip(normal_points_atm, min_spread, max_spread)
-        
-        # Normal distribution around zero for higher density (if zero is in range)
-        if min_spread <= 0 and max_spread >= 0:
-            normal_points_zero = np.random.normal(0, normal_std, num_points // 3)
-            normal_points_zero = np.clip(normal_points_zero, min_spread, max_spread)
-        else:
-            normal_points_zero = np.array([])
-        
-        # Combine all distributions
-        all_points = np.concatenate([uniform_points, normal_points_atm, normal_points_zero])
-        
-        # Add key relative points
-        for rel in [-0.5, -0.25, -0.1, -0.05, 0, 0.05, 0.1, 0.25, 0.5]:
-            point = forward * (1 + rel)
-            if min_spread <= point <= max_spread:
-                all_points = np.append(all_points, point)
-        
-        # Add exact forward point and zero
-        all_points = np.append(all_points, forward)
-        if min_spread <= 0 <= max_spread:
-            all_points = np.append(all_points, 0)
-        
-        # Sort and remove duplicates
-        result = np.sort(np.unique(all_points))
-        
-        return result
+        # Grids depend only on these inputs, so repeated surfaces reuse them
+        return _spread_grid(float(forward), float(min_spread), float(max_spread), int(num_points))
     
     def heston_implied_vol(self, moneyness, time_to_maturity, params, option_type="call"):
         """
         Calculate the implied volatility from the Heston model.
         Enhanced implementation for stronger smile shape.
+        
+        params may be a parameter dictionary or a (v0, kappa, theta, sigma, rho)
+        tuple; callers evaluating many strikes should unpack once and pass the tuple.
+        moneyness may also be an array, in which case an array of vols is returned.
         """
         
+        # Whole smiles are evaluated in one vectorized pass
+        if np.ndim(moneyness) > 0:
+            return self._heston_implied_vol_vec(np.asarray(moneyness, dtype=np.float64),
+                                                _unpack_heston_params(params))
+        
         # Ensure moneyness is valid
-        if moneyness <= 0 or not np.isfinite(moneyness):
-            print(f"WARNING - Invalid moneyness: {moneyness}, using default volatility")
+        if moneyness <= 0 or not math.isfinite(moneyness):
+            logger.warning("Invalid moneyness: %s, using default volatility", moneyness)
             return 0.25  # Default reasonable volatility
         
         # Extract parameters
-        v0 = params.get("v0", 0.04)
-        kappa = params.get("kappa", 1.5)
-        theta = params.get("theta", 0.04)
-        sigma = params.get("sigma", 0.3)
-        rho = params.get("rho", -0.7)
+        v0, kappa, theta, sigma, rho = _unpack_heston_params(params)
+        
+        # Compiled kernel when Numba is available
+        if NUMBA_AVAILABLE:
+            return heston_iv(float(moneyness), float(v0), float(kappa), float(sigma), float(rho))
         
         # Calculate log-moneyness
-        log_moneyness = np.log(moneyness)
+        log_moneyness = math.log(moneyness)
         
         # IMPROVED VOLATILITY FORMULA
         
         # Base ATM volatility
-        atm_vol = np.sqrt(v0)
+        atm_vol = math.sqrt(v0)
         
         # Calculate skew term - controls linear slope of smile
         # The formula is adjusted to create more pronounced effect
@@ -622,7 +1086,7 @@ class VolatilityModel:
 
         
         # Apply reasonable bounds but allow wide enough range for smile
-        implied_vol = max(0.01, min(raw_implied_vol, 2.0))
+        implied_vol = _clip(raw_implied_vol, 0.01, 2.0)
         
         # Debug if bounds were applied
 
@@ -635,42 +1099,133 @@ class VolatilityModel:
         
         Args:
             forward: Forward price
-            strike: Strike price
+            strike: Strike price, or an array of strikes
             time_to_maturity: Time to maturity in years
-            volatility: Volatility
+            volatility: Volatility, or an array of volatilities
             option_type: "call" or "put"
             
+        Returns:
+            float: Delta value, or an array of deltas for array inputs
+        """
+        # Whole smiles are evaluated in one vectorized pass
+        if np.ndim(strike) > 0 or np.ndim(volatility) > 0:
+            return self._bachelier_delta_vec(forward, strike, time_to_maturity, volatility,
+                                             _is_call(option_type))
+        
+        return self._bachelier_delta_fast(forward, strike, math.sqrt(max(time_to_maturity, 0.0)),
+                                          volatility, _is_call(option_type))
+    
+    @staticmethod
+    def _bachelier_delta_fast(forward, strike, sqrt_t, volatility, is_call):
+        """
+        Bachelier delta with the time scaling and option type already resolved.
+        
+        Args:
+            forward: Forward price
+            strike: Strike price
+            sqrt_t: Square root of the time to maturity in years
+            volatility: Volatility
+            is_call: True for calls, False for puts
+            
         Returns:
             float: Delta value
         """
         # Avoid division by zero
-        if volatility <= 0 or time_to_maturity <= 0:
+        if volatility <= 0 or sqrt_t <= 0:
             # For at-the-money options
             if abs(forward - strike) < 0.0001:
-                return 0.5 if option_type.lower() == 'call' else -0.5
+                return 0.5 if is_call else -0.5
             # For in-the-money calls
-            elif forward > strike and option_type.lower() == 'call':
+            elif forward > strike and is_call:
                 return 1.0
             # For in-the-money puts
-            elif forward < strike and option_type.lower() == 'put':
+            elif forward < strike and not is_call:
                 return -1.0
-            # For out-of-money calls
-            elif forward < strike and option_type.lower() == 'call':
-                return 0.0
-            # For out-of-money puts
+            # For out-of-money options
             else:
                 return 0.0
         
         # Calculate d term for Bachelier model
-        d = (forward - strike) / (volatility * np.sqrt(time_to_maturity))
+        d = (forward - strike) / (volatility * sqrt_t)
         
-        # Calculate delta
-        if option_type.lower() == 'call':
-            delta = norm.cdf(d)
-        else:  # put
-            delta = norm.cdf(d) - 1
+        # Calculate delta, normal CDF through math.erfc as for the compiled kernel
+        cdf = 0.5 * math.erfc(-d / math.sqrt(2.0))
+        return cdf if is_call else cdf - 1
+    
+    @staticmethod
+    def _heston_implied_vol_vec(moneyness, heston_values):
+        """
+        Vectorized heston_implied_vol over an array of moneyness values.
         
-        return delta
+        Args:
+            moneyness: Array of moneyness values (K/F)
+            heston_values: (v0, kappa, theta, sigma, rho) tuple
+            
+        Returns:
+            np.ndarray: Implied volatilities as decimals
+        """
+        v0, kappa, theta, sigma, rho = heston_values
+        
+        # Default volatility where moneyness is invalid
+        valid = (moneyness > 0) & np.isfinite(moneyness)
+        if not valid.all():
+            logger.warning(f"Invalid moneyness for {np.count_nonzero(~valid)} strikes, using default volatility")
+        
+        # Compiled kernel when Numba is available, it takes 1-D moneyness
+        if NUMBA_AVAILABLE:
+            moneyness = np.asarray(moneyness, dtype=np.float64)
+            implied_vols = heston_ivs(np.ascontiguousarray(moneyness).ravel(), float(v0),
+                                      float(kappa), float(sigma), float(rho))
+            return implied_vols.reshape(moneyness.shape)
+        
+        log_moneyness = np.log(np.where(valid, moneyness, 1.0))
+        
+        skew_term = rho * sigma / kappa
+        curvature_term = (1 - rho**2) * sigma**2 / (2 * kappa**2)
+        raw_implied_vol = math.sqrt(v0) * (1 + skew_term * log_moneyness + curvature_term * log_moneyness**2)
+        np.clip(raw_implied_vol, 0.01, 2.0, out=raw_implied_vol)
+        return np.where(valid, raw_implied_vol, 0.25)
+    
+    @staticmethod
+    def _bachelier_delta_vec(forward, strikes, time_to_maturity, volatilities, is_call):
+        """
+        Vectorized Bachelier delta, matching _calculate_bachelier_delta per strike.
+        
+        Args:
+            forward: Forward price
+            strikes: Array of strike prices
+            time_to_maturity: Time to maturity in years
+            volatilities: Array of normal volatilities, one per strike
+            is_call: True for calls, False for puts
+            
+        Returns:
+            np.ndarray: Delta values
+        """
+        strikes = np.asarray(strikes, dtype=np.float64)
+        volatilities = np.asarray(volatilities, dtype=np.float64)
+        
+        # Compiled kernel when Numba is available
+        if NUMBA_AVAILABLE:
+            strikes, volatilities = np.broadcast_arrays(strikes, volatilities)
+            deltas = bachelier_deltas(float(forward), np.ascontiguousarray(strikes).ravel(),
+                                      math.sqrt(max(time_to_maturity, 0.0)),
+                                      np.ascontiguousarray(volatilities).ravel(), is_call)
+            return deltas.reshape(strikes.shape)
+        
+        # Calculate d term for Bachelier model
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d = (forward - strikes) / (volatilities * math.sqrt(max(time_to_maturity, 0.0)))
+        deltas = ndtr(d) if is_call else ndtr(d) - 1
+        
+        # Zero volatility or maturity: delta is the intrinsic exercise indicator
+        degenerate = (volatilities <= 0) | (time_to_maturity <= 0)
+        if np.any(degenerate):
+            in_the_money = (strikes < forward) if is_call else (strikes > forward)
+            intrinsic = np.where(np.abs(forward - strikes) < 0.0001, 0.5 if is_call else -0.5,
+                                 np.where(in_the_money, 1.0 if is_call else -1.0, 0.0))
+            deltas = np.where(degenerate, intrinsic, deltas)
+        
+        return deltas
     
     def _get_historical_volatility(self, index, evaluation_date, days=90):
         """
@@ -684,22 +1239,30 @@ class VolatilityModel:
         Returns:
             float: Annualized volatility
         """
+        # If no data provider, use default volatility
+        if not self.data_provider:
+            return self.default_volatilities.get(index, 0.35)
+        
         try:
-            if self.data_provider:
-                # Calculate start date
-                start_date = evaluation_date - timedelta(days=days)
-                start_date_str = start_date.strftime('%Y-%m-%d')
-                end_date_str = evaluation_date.strftime('%Y-%m-%d')
-                
-                # Fetch historical data
-                price_series = self.data_provider.fetch_data(index, start_date_str, end_date_str)
-                
-                # Calculate volatility
-                vol = self.estimate_volatility_from_historical_data(price_series)
-                return vol
-            else:
-                # If no data provider, use default volatility
+            # History window as provider date strings
+            start_date_str, end_date_str = _history_window(evaluation_date, days)
+            
+            cache_key = (index, start_date_str, end_date_str)
+            if cache_key in self._hist_vol_cache:
+                return self._hist_vol_cache[cache_key]
+            
+            # Fetch historical data
+            price_series = self._fetch_data(index, start_date_str, end_date_str)
+            
+            if price_series.count() < 5:
+                # Not cached, the default follows later changes to default_volatilities
+                logger.warning(f"Insufficient data for {index} volatility, using default")
                 return self.default_volatilities.get(index, 0.35)
+            
+            # Calculate volatility
+            vol = self.estimate_volatility_from_historical_data(price_series)
+            self._hist_vol_cache[cache_key] = vol
+            return vol
         except Exception as e:
             logger.warning(f"Failed to get historical volatility for {index}: {e}")
             return self.default_volatilities.get(index, 0.35)
@@ -717,40 +1280,73 @@ class VolatilityModel:
         Returns:
             float: Annualized spread volatility
         """
+        # If no data provider, use default spread volatility
+        if not self.data_provider:
+            return self._default_spread_volatility(index1, index2)
+        
         try:
-            if self.data_provider:
-                # Calculate start date
-                start_date = evaluation_date - timedelta(days=days)
-                start_date_str = start_date.strftime('%Y-%m-%d')
-                end_date_str = evaluation_date.strftime('%Y-%m-%d')
-                
-                # Fetch historical data for both indices
-                series1 = self.data_provider.fetch_data(index1, start_date_str, end_date_str)
-                series2 = self.data_provider.fetch_data(index2, start_date_str, end_date_str)
-                
-                # Align on matching dates
-                aligned_data = pd.DataFrame({
-                    'index1': series1,
-                    'index2': series2
-                }).dropna()
-                
-                if len(aligned_data) < 5:
-                    logger.warning(f"Insufficient aligned data for {index1}-{index2}, using fallback")
-                    return max(0.3, (self.default_volatilities.get(index1, 0.35) + self.default_volatilities.get(index2, 0.35)) / 2)
-                
-                # Calculate spread series
-                spread_series = aligned_data['index1'] - aligned_data['index2']
-                
-                # Calculate volatility
-                vol = self.estimate_volatility_from_historical_data(spread_series)
-                return vol
-            else:
-                # If no data provider, use default spread volatility
-                return max(0.3, (self.default_volatilities.get(index1, 0.35) + self.default_volatilities.get(index2, 0.35)) / 2)
+            # History window as provider date strings
+            start_date_str, end_date_str = _history_window(evaluation_date, days)
+            
+            # Spread vol is symmetric in the pair
+            cache_key = (tuple(sorted((index1, index2))), start_date_str, end_date_str)
+            if cache_key in self._spread_vol_cache:
+                return self._spread_vol_cache[cache_key]
+            
+            # Fetch historical data for both indices
+            series1 = self._fetch_data(index1, start_date_str, end_date_str)
+            series2 = self._fetch_data(index2, start_date_str, end_date_str)
+            
+            # Align on matching dates
+            prices1, prices2 = self._align_prices(series1, series2)
+            
+            if prices1.size < 5:
+                logger.warning(f"Insufficient aligned data for {index1}-{index2}, using fallback")
+                return self._default_spread_volatility(index1, index2)
+            
+            # Calculate volatility of the spread series
+            vol = self.estimate_volatility_from_historical_data(prices1 - prices2)
+            self._spread_vol_cache[cache_key] = vol
+            return vol
         except Exception as e:
             logger.warning(f"Failed to get historical spread volatility for {index1}-{index2}: {e}")
-            return max(0.3, (self.default_volatilities.get(index1, 0.35) + self.default_volatilities.get(index2, 0.35)) / 2)
+            return self._default_spread_volatility(index1, index2)
 
+    def _default_spread_volatility(self, index1, index2):
+        """
+        Spread volatility used when no usable history is available.
+        
+        Args:
+            index1: First index
+            index2: Second index
+            
+        Returns:
+            float: Average of the default volatilities, at least 0.3
+        """
+        default_vols = self.default_volatilities
+        return max(0.3, (default_vols.get(index1, 0.35) + default_vols.get(index2, 0.35)) / 2)
+    
+    @staticmethod
+    def _align_prices(series1, series2):
+        """
+        Align two price series on their common dates.
+        
+        Args:
+            series1: First price series
+            series2: Second price series
+            
+        Returns:
+            tuple: Two float64 arrays in chronological order, holding the dates
+                where both series have a price
+        """
+        series1, series2 = series1.align(series2, join='inner')
+        if not series1.index.is_monotonic_increasing:
+            series1, series2 = series1.sort_index(), series2.sort_index()
+        prices1 = series1.to_numpy(dtype=np.float64)
+        prices2 = series2.to_numpy(dtype=np.float64)
+        mask = ~(np.isnan(prices1) | np.isnan(prices2))
+        return prices1[mask], prices2[mask]
+    
     def _calculate_correlation(self, index1, index2, evaluation_date, days=90):
         """
         Calculate correlation between two indices.
@@ -764,147 +1360,134 @@ class VolatilityModel:
         Returns:
             float: Correlation coefficient
         """
+        # If no data provider, use default correlation
+        if not self.data_provider:
+            return 0.7  # Default correlation
+        
         try:
-            if self.data_provider:
-                # Calculate start date
-                start_date = evaluation_date - timedelta(days=days)
-                start_date_str = start_date.strftime('%Y-%m-%d')
-                end_date_str = evaluation_date.strftime('%Y-%m-%d')
-                
-                # Fetch historical data for both indices
-                series1 = self.data_provider.fetch_data(index1, start_date_str, end_date_str)
-                series2 = self.data_provider.fetch_data(index2, start_date_str, end_date_str)
-                
-                # Align on matching dates
-                aligned_data = pd.DataFrame({
-                    'index1': series1,
-                    'index2': series2
-                }).dropna()
-                
-                if len(aligned_data) < 5:
-                    logger.warning(f"Insufficient aligned data for correlation of {index1}-{index2}, using fallback")
-                    return 0.7  # Default high correlation for energy indices
-                
-                # Calculate correlation
-                return aligned_data['index1'].corr(aligned_data['index2'])
-            else:
-                return 0.7  # Default correlation
+            # History window as provider date strings
+            start_date_str, end_date_str = _history_window(evaluation_date, days)
+            
+            # Correlation is symmetric in the pair
+            cache_key = (tuple(sorted((index1, index2))), start_date_str, end_date_str)
+            if cache_key in self._correlation_cache:
+                return self._correlation_cache[cache_key]
+            
+            # Fetch historical data for both indices
+            series1 = self._fetch_data(index1, start_date_str, end_date_str)
+            series2 = self._fetch_data(index2, start_date_str, end_date_str)
+            
+            # Align on matching dates
+            prices1, prices2 = self._align_prices(series1, series2)
+            
+            if prices1.size < 5:
+                logger.warning(f"Insufficient aligned data for correlation of {index1}-{index2}, using fallback")
+                return 0.7  # Default high correlation for energy indices
+            
+            # Calculate correlation
+            correlation = _pearson(prices1, prices2)
+            self._correlation_cache[cache_key] = correlation
+            return correlation
         except Exception as e:
             logger.warning(f"Failed to calculate correlation for {index1}-{index2}: {e}")
             return 0.7  # Default correlation
 
-    def _generate_fallback_volatility_surface(self, indices, base_prices):
+    def _generate_fallback_volatility_surface(self, indices, base_prices, columnar=False):
         """
         Generate a fallback volatility surface when the main method fails.
         
         Args:
             indices: List of indices
             base_prices: Dictionary of base prices
+            columnar: Return smiles as dicts of arrays instead of point lists
             
         Returns:
             dict: Volatility surface data
         """
         result = {}
         
+        # Spread strike grid positions, forwards and default vols shared by every fallback smile
+        grid = np.arange(7)
+        forwards = {index: base_prices.get(index, 10.0) for index in indices}
+        default_vols = {index: self.default_volatilities.get(index, 0.35) for index in indices}
+        
         # Generate simple volatility smiles for individual indices
         for index in indices:
-            forward = base_prices.get(index, 10.0)
-            vol = self.default_volatilities.get(index, 0.35)
-            
-            smile = []
-            for i in range(7):
-                strike = forward * (0.7 + i * 0.1)  # 70% to 130% of forward
-                rel_strike = ((strike / forward) - 1) * 100
-                normal_vol = vol * (1 + 0.1 * (rel_strike / 30)**2)  # Simple quadratic adjustment
-                percentage_vol = (normal_vol / forward) * 100
-                delta = self._calculate_bachelier_delta(forward, strike, 0.25, normal_vol, "call")
-                
-                smile.append({
-                    'strike': float(strike),
-                    'volatility': float(normal_vol),
-                    'percentage_vol': float(percentage_vol),
-                    'delta': float(delta),
-                    'relative_strike': float(rel_strike),
-                    'time_to_maturity': 0.25
-                })
+            forward = forwards[index]
+            vol = default_vols[index]
+            
+            strikes = forward * _FALLBACK_MULTIPLIERS
+            normal_vols = vol * _FALLBACK_SKEW  # Simple quadratic adjustment
             
-            result[index] = smile
+            result[index] = {
+                'strike': strikes,
+                'volatility': normal_vols,
+                'percentage_vol': (normal_vols / forward) * 100,
+                'delta': self._bachelier_delta_vec(forward, strikes, 0.25, normal_vols, True),
+                'relative_strike': _FALLBACK_REL_STRIKES,
+                'time_to_maturity': 0.25
+            }
         
         # Generate spread smiles if needed
         if len(indices) > 1:
-            for i, index1 in enumerate(indices):
-                for j, index2 in enumerate(indices):
-                    if i < j:
-                        spread_name = f"{index1}-{index2}"
-                        spread_forward = base_prices.get(spread_name, 
-                                                        base_prices.get(index1, 10.0) - 
-                                                        base_prices.get(index2, 9.0))
-                        
-                        # Use higher volatility for spreads
-                        spread_vol = max(0.3, 
-                                        self.default_volatilities.get(index1, 0.35) + 
-                                        self.default_volatilities.get(index2, 0.35)) / 1.5
-                        
-                        smile = []
-                        min_spread = min(spread_forward * 0.5, 0)
-                        max_spread = max(spread_forward * 1.5, 0)
-                        if min_spread == max_spread:
-                            min_spread = -1.0
-                            max_spread = 1.0
-                        
-                        for i in range(7):
-                            strike = min_spread + (max_spread - min_spread) * i / 6
-                            rel_strike = ((strike / max(0.01, abs(spread_forward))) - 1) * 100
-                            normal_vol = spread_vol * (1 + 0.1 * (rel_strike / 30)**2)
-                            percentage_vol = (normal_vol / max(0.01, abs(spread_forward))) * 100
-                            delta = self._calculate_bachelier_delta(spread_forward, strike, 0.25, normal_vol, "call")
-                            
-                            smile.append({
-                                'strike': float(strike),
-                                'volatility': float(normal_vol),
-                                'percentage_vol': float(percentage_vol),
-                                'delta': float(delta),
-                                'relative_strike': float(rel_strike),
-                                'time_to_maturity': 0.25
-                            })
-                        
-                        result[spread_name] = smile
+            for index1, index2 in combinations(indices, 2):
+                spread_name = f"{index1}-{index2}"
+                if spread_name in base_prices:
+                    spread_forward = base_prices[spread_name]
+                else:
+                    # A missing second leg defaults to 9.0, not the outright 10.0
+                    spread_forward = forwards[index1] - base_prices.get(index2, 9.0)
+                
+                # Use higher volatility for spreads
+                spread_vol = max(0.3, default_vols[index1] + default_vols[index2]) / 1.5
+                
+                min_spread = min(spread_forward * 0.5, 0)
+                max_spread = max(spread_forward * 1.5, 0)
+                if min_spread == max_spread:
+                    min_spread = -1.0
+                    max_spread = 1.0
+                
+                reference_value = max(0.01, abs(spread_forward))
+                strikes = min_spread + (max_spread - min_spread) * grid / 6
+                rel_strikes = ((strikes / reference_value) - 1) * 100
+                normal_vols = spread_vol * (1 + 0.1 * (rel_strikes / 30)**2)
+                
+                result[spread_name] = {
+                    'strike': strikes,
+                    'volatility': normal_vols,
+                    'percentage_vol': (normal_vols / reference_value) * 100,
+                    'delta': self._bachelier_delta_vec(spread_forward, strikes, 0.25, normal_vols, True),
+                    'relative_strike': rel_strikes,
+                    'time_to_maturity': 0.25
+                }
         
         logger.warning(f"Using fallback volatility surface with {len(result)} keys")
-        return result
+        return result if columnar else self.surface_to_records(result)
 
     def calibrate_spread_parameters(self, index, base_vol, time_to_maturity):
         """
         Special calibration method for spread options that handles volatility properly.
         """
-        print(f"DEBUG - calibrate_spread_parameters for {index}: base_vol={base_vol}, time={time_to_maturity}")
-        
         # For spread options, base_vol is already in percentage terms
         # Convert from percentage to decimal for parameter calculation
         decimal_vol = base_vol / 100.0
-        print(f"DEBUG - Using percentage vol {base_vol}% as decimal {decimal_vol}")
         
         # Initial variance (v0) is square of volatility decimal
         v0 = decimal_vol**2
-        print(f"DEBUG - v0 (initial variance): {v0}")
         
         # Use moderate kappa for spread options
         kappa = 0.5
-        print(f"DEBUG - Spread kappa (mean reversion): {kappa}")
         
         # Long-run variance
         theta = v0
-        print(f"DEBUG - theta (long-run variance): {theta}")
         
         # Volatility of volatility - important for smile shape
         # Use proportional approach
         sigma = 0.5  # Moderate value for stable results
-        print(f"DEBUG - sigma (vol-of-vol): {sigma}")
         
         # Correlation parameter - controls asymmetry
         # Use moderate negative value for realistic downward skew
         rho = -0.3
-        print(f"DEBUG - rho (correlation): {rho}")
         
         # Build parameters dict
         result = {
@@ -915,6 +1498,8 @@ class VolatilityModel:
             'rho': rho
         }
         
-        print(f"DEBUG - Final calibrated spread params: {result}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calibrated spread params for %s (base_vol=%s, time=%s): %s",
+                         index, base_vol, time_to_maturity, result)
         
         return result
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""
+Test configuration: make the backend packages importable as in the app.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
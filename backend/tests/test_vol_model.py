@@ -0,0 +1,94 @@
+"""
+Regression tests for the volatility model.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.volatility import VolatilityModel
+
+
+class SeriesProvider:
+    """
+    Data provider returning fixed price series by ticker.
+    """
+    
+    def __init__(self, series):
+        self.series = series
+    
+    def fetch_data(self, ticker, start_date, end_date, field='PX_LAST'):
+        return self.series[ticker]
+
+
+def _random_walk(seed, dates):
+    rng = np.random.default_rng(seed)
+    return pd.Series(10 + np.cumsum(rng.normal(0, 0.2, len(dates))), index=dates)
+
+
+@pytest.fixture
+def daily_series():
+    dates = pd.date_range('2024-01-01', '2024-06-01')
+    return {
+        'A': _random_walk(1, dates),
+        'B': _random_walk(2, dates),
+        'C': _random_walk(3, dates)[::3],
+    }
+
+
+def _calculate(series, indices):
+    model = VolatilityModel(SeriesProvider(series))
+    return model.calculate_volatility(indices, '2024-06-01', '2024-12-01')
+
+
+def test_pair_results_do_not_depend_on_other_indices(daily_series):
+    alone = _calculate(daily_series, ['A', 'B'])
+    with_sparse_index = _calculate(daily_series, ['A', 'B', 'C'])
+    
+    assert with_sparse_index['spreads']['A-B'] == pytest.approx(alone['spreads']['A-B'])
+    assert with_sparse_index['individual']['A'] == pytest.approx(alone['individual']['A'])
+
+
+def test_pair_correlation_uses_price_changes_with_or_without_gaps(daily_series):
+    alone = _calculate(daily_series, ['A', 'B'])
+    with_sparse_index = _calculate(daily_series, ['A', 'B', 'C'])
+    expected = np.corrcoef(np.diff(daily_series['A']), np.diff(daily_series['B']))[0, 1]
+    
+    assert alone['correlations']['A-B'] == pytest.approx(expected)
+    assert with_sparse_index['correlations']['A-B'] == pytest.approx(expected)
+
+
+def test_empty_indices_give_empty_results(daily_series):
+    result = _calculate(daily_series, [])
+    
+    assert result['individual'] == {}
+    assert result['spreads'] == {}
+    assert result['correlations'] == {}
+
+
+def test_duplicate_indices_are_calculated_once(daily_series):
+    result = _calculate(daily_series, ['A', 'B', 'A'])
+    expected = _calculate(daily_series, ['A', 'B'])
+    
+    assert list(result['individual']) == ['A', 'B']
+    assert list(result['spreads']) == ['A-B']
+    assert result['spreads']['A-B'] == pytest.approx(expected['spreads']['A-B'])
+
+
+def test_short_history_default_is_scaled_to_normal_vol(daily_series):
+    daily_series['D'] = pd.Series([50.0, 50.0, 50.0], index=pd.date_range('2024-05-01', periods=3))
+    model = VolatilityModel(SeriesProvider(daily_series))
+    result = model.calculate_volatility(['A', 'D'], '2024-06-01', '2024-12-01')
+    
+    assert result['individual']['D'] == pytest.approx(model.default_volatilities.get('D', 0.35) * 50.0)
+
+
+def test_heston_implied_vols_keep_the_moneyness_shape():
+    heston_values = (0.04, 2.0, 0.04, 0.3, -0.5)
+    moneyness = np.array([[0.8, 1.0, 1.2], [0.9, 1.1, -1.0]])
+    
+    implied_vols = VolatilityModel._heston_implied_vol_vec(moneyness, heston_values)
+    expected = VolatilityModel._heston_implied_vol_vec(moneyness.ravel(), heston_values)
+    
+    assert implied_vols.shape == moneyness.shape
+    np.testing.assert_allclose(implied_vols.ravel(), expected)